@@ -0,0 +1,108 @@
+"""
+Synthetic data generators for the benchmark suite. Every generator takes
+a size and a seed so runs at the same scale see the same data.
+"""
+import random
+import string
+
+from oops.bank import CheckingAccount, SavingsAccount
+from oops.courses import Course, Student
+from oops.grades import GradeManager
+from oops import shopping_cart
+from oops.shopping_cart import Customer, Product, SalesAnalytics, ShoppingCart
+
+SUBJECTS = ['Math', 'Science', 'English', 'History', 'Art', 'Music']
+CATEGORIES = ['Electronics', 'Books', 'Clothing', 'Toys', 'Garden']
+MEMBERSHIPS = ['basic', 'gold', 'premium']
+
+
+def make_accounts(n, seed=0):
+    """
+    Returns:
+        tuple: (list of accounts, list of withdrawal amounts)
+    """
+    rng = random.Random(seed)
+    accounts = []
+    for i in range(n):
+        if i % 2:
+            accounts.append(SavingsAccount(f"SA{i}", f"Holder {i}", rng.randint(0, 5000), 2.5))
+        else:
+            accounts.append(CheckingAccount(f"CA{i}", f"Holder {i}", rng.randint(0, 5000), 500))
+    amounts = [rng.randint(1, 1000) for _ in range(n)]
+    return accounts, amounts
+
+
+def make_enrollment(n, seed=0):
+    """
+    Create courses holding up to 100 students each and n students
+    Returns:
+        tuple: (list of courses, list of students)
+    """
+    rng = random.Random(seed)
+    Course.all_courses.clear()
+    Student.all_students.clear()
+    courses = [Course(f"C{i}", f"Course {i}", f"Instructor {i}", 3, 100) for i in range(max(1, n // 50))]
+    students = [Student(f"S{i}", f"Student {i}", f"s{i}@uni.edu", rng.choice(SUBJECTS)) for i in range(n)]
+    return courses, students
+
+
+def make_grades(n, seed=0):
+    """
+    Create a grade manager with n students, each graded in every subject
+    """
+    rng = random.Random(seed)
+    manager = GradeManager()
+    for i in range(n):
+        for subject in SUBJECTS:
+            manager.add_grade(f"Student {i}", subject, rng.uniform(40, 100))
+    return manager
+
+
+def make_text(n, seed=0):
+    """
+    Create text of n words split into sentences of 5 to 20 words
+    """
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(500)]
+    sentences = []
+    remaining = n
+    while remaining > 0:
+        length = min(remaining, rng.randint(5, 20))
+        sentences.append(' '.join(rng.choices(vocabulary, k=length)).capitalize() + '.')
+        remaining -= length
+    return ' '.join(sentences)
+
+
+def make_carts(n, seed=0):
+    """
+    Create n carts holding 1 to 10 products each from a catalogue of n products
+    Returns:
+        tuple: (list of products, list of carts)
+    """
+    rng = random.Random(seed)
+    Product._products.clear()
+    Product._products_by_id.clear()
+    shopping_cart.sales_analytics = SalesAnalytics()
+    ShoppingCart._carts_by_product.clear()
+    products = [Product(f"P{i}", f"Product {i}", round(rng.uniform(1, 500), 2), rng.choice(CATEGORIES), 10 ** 6)
+                for i in range(n)]
+    carts = []
+    for i in range(n):
+        cart = ShoppingCart(Customer(f"C{i}", f"Customer {i}", f"c{i}@shop.com", rng.choice(MEMBERSHIPS)))
+        for product in rng.sample(products, rng.randint(1, min(10, n))):
+            cart.add_item(product, rng.randint(1, 5))
+        carts.append(cart)
+    Customer._customers.clear()
+    return products, carts
+
+
+def make_friend_networks(n, seed=0):
+    """
+    Create friend sets for the four platforms, each holding about half of
+    a population of n people
+    Returns:
+        tuple: (facebook, instagram, twitter, linkedin) sets of names
+    """
+    rng = random.Random(seed)
+    people = [f"person{i}" for i in range(n)]
+    return tuple(set(rng.sample(people, n // 2)) for _ in range(4))
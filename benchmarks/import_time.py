@@ -0,0 +1,104 @@
+"""
+Import-time benchmark for the oops package.
+
+Each module is imported in a fresh interpreter with ``-X importtime``.
+Its cumulative import time is divided by the time the same interpreter
+spent on its own startup imports (site, encodings, io, ...), which makes
+the figure comparable across machines and load levels. The best ratio
+over several runs is compared with the stored baseline; absolute times
+are printed for information only. The run fails if a module's ratio
+grows past the allowed tolerance or the module prints anything while
+being imported.
+
+Usage:
+    python benchmarks/import_time.py            # check against baseline
+    python benchmarks/import_time.py --update   # record a new baseline
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_time.json')
+MODULES = ['oops', 'oops.bank', 'oops.courses', 'oops.grades',
+           'oops.text_analysis', 'oops.social_media', 'oops.shopping_cart']
+
+# Relative growth allowed in a module's import cost ratio
+TOLERANCE = 0.5
+
+
+def measure(module, runs=10):
+    """
+    Import a module in fresh interpreters
+    Args:
+        module (str): Dotted module name
+        runs (int): Number of interpreters to start
+    Returns:
+        tuple: (best import cost ratio, import time in microseconds for
+                that run, captured stdout)
+    """
+    best = None
+    output = ''
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                              cwd=ROOT, capture_output=True, text=True, check=True)
+        output = proc.stdout
+        elapsed = startup = 0
+        for line in proc.stderr.splitlines()[1:]:
+            parts = line.split('|')
+            name = parts[2].rstrip()
+            # Only top-level imports are counted; nested ones show up indented
+            if name.startswith('  '):
+                continue
+            if name.strip() == module:
+                elapsed = int(parts[1])
+            else:
+                startup += int(parts[1])
+        ratio = elapsed / startup
+        if best is None or ratio < best[0]:
+            best = (ratio, elapsed)
+    return best[0], best[1], output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--update', action='store_true', help='record a new baseline')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+
+    results = {}
+    failures = []
+    for module in MODULES:
+        ratio, elapsed, output = measure(module, args.runs)
+        results[module] = round(ratio, 3)
+        status = 'ok'
+        if output:
+            status = 'SIDE EFFECT'
+            failures.append(f"{module} printed output on import")
+        elif not args.update and module in baseline:
+            if ratio > baseline[module] * (1 + TOLERANCE):
+                status = 'REGRESSION'
+                failures.append(f"{module} import cost {ratio:.2f}x startup (baseline {baseline[module]:.2f}x)")
+        print(f"{module:<22} {ratio:6.2f}x startup  baseline {baseline.get(module, '-'):>6}  "
+              f"({elapsed}us)  {status}")
+
+    if args.update:
+        with open(BASELINE, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Baseline written to {BASELINE}")
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Benchmark suite covering the hot paths of all six systems.
+
+Each case is timed at several scales on synthetic data. Times are divided
+by a fixed pure-Python calibration workload timed right before the case,
+so the stored baselines compare across machines of different speeds and
+follow load changes during the run. Cases whose
+normalised time grows past the tolerance are reported as regressions and
+make the run fail. The machine a baseline was recorded on is stored with
+it for reference.
+
+Usage:
+    python benchmarks/run.py                     # check against baselines
+    python benchmarks/run.py --update            # record new baselines
+    python benchmarks/run.py --scale small       # run a single scale
+    python benchmarks/run.py --instrument        # also print probe statistics
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import generators  # noqa: E402
+from oops import instrumentation, social_media  # noqa: E402
+from oops.shopping_cart import ShoppingCart  # noqa: E402
+from oops.text_analysis import TextAnalyzer  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+SCALES = {'small': 100, 'medium': 1000, 'large': 10000}
+
+
+def bench_withdraw(n):
+    accounts, amounts = generators.make_accounts(n)
+
+    def run():
+        for account, amount in zip(accounts, amounts):
+            account.withdraw(amount)
+    return run
+
+
+def bench_enroll_student(n):
+    courses, students = generators.make_enrollment(n)
+
+    def run():
+        for i, student in enumerate(students):
+            for offset in range(3):
+                student.enroll_in_course(courses[(i + offset) % len(courses)])
+    return run
+
+
+def bench_subject_statistics(n):
+    manager = generators.make_grades(n)
+
+    def run():
+        for subject in generators.SUBJECTS:
+            manager.get_subject_statistics(subject)
+    return run
+
+
+def bench_word_frequency(n):
+    analyzer = TextAnalyzer(generators.make_text(n * 10))
+
+    def run():
+        analyzer.get_word_frequency()
+    return run
+
+
+def bench_analyze_friendships(n):
+    networks = generators.make_friend_networks(n * 10)
+
+    def run():
+        social_media.analyze_friendships(*networks)
+    return run
+
+
+def bench_place_order(n):
+    _, carts = generators.make_carts(n)
+
+    def run():
+        for cart in carts:
+            cart.place_order()
+    return run
+
+
+def bench_reprice(n):
+    products, carts = generators.make_carts(n)
+    new_prices = {product.product_id: product.price * 1.1 for product in products[::10]}
+
+    def run():
+        # The cart index holds carts weakly, so keep them alive while timing
+        ShoppingCart.reprice(new_prices)
+        return carts
+    return run
+
+
+CASES = {
+    'bank.withdraw': bench_withdraw,
+    'courses.enroll_student': bench_enroll_student,
+    'grades.get_subject_statistics': bench_subject_statistics,
+    'text_analysis.get_word_frequency': bench_word_frequency,
+    'social_media.analyze_friendships': bench_analyze_friendships,
+    'shopping_cart.place_order': bench_place_order,
+    'shopping_cart.reprice': bench_reprice,
+}
+
+
+def measure(setup, n, repeat, min_time=0.05, max_repeat=25):
+    """
+    Time a case on fresh data for each repeat. Fast cases are repeated
+    until min_time has been spent timing them, so the best time is stable.
+    Args:
+        setup (callable): Builds the data for size n and returns the timed callable
+        n (int): Data size
+        repeat (int): Minimum number of timed runs
+        min_time (float): Minimum total timed seconds
+        max_repeat (int): Maximum number of timed runs
+    Returns:
+        float: Best wall-clock time in seconds
+    """
+    best = None
+    total = 0
+    runs = 0
+    while runs < repeat or (total < min_time and runs < max_repeat):
+        runs += 1
+        run = setup(n)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        total += elapsed
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def calibrate(repeat=3):
+    """
+    Time a fixed mix of loops, arithmetic and dict/list work
+    Returns:
+        float: Best wall-clock time in seconds
+    """
+    def workload():
+        counts = {}
+        items = []
+        for i in range(200000):
+            key = i % 1000
+            counts[key] = counts.get(key, 0) + i * i
+            items.append(key)
+        items.sort()
+    return measure(lambda n: workload, 0, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--update', action='store_true', help='record new baselines')
+    parser.add_argument('--scale', choices=SCALES, action='append', help='scale to run (default: all)')
+    parser.add_argument('--case', choices=CASES, action='append', help='case to run (default: all)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=0.5, help='allowed relative slowdown')
+    parser.add_argument('--instrument', action='store_true', help='enable probes and report their statistics')
+    args = parser.parse_args()
+
+    baselines = {'cases': {}}
+    if os.path.exists(BASELINES):
+        with open(BASELINES) as f:
+            baselines = json.load(f)
+
+    if args.instrument:
+        instrumentation.enable()
+
+    regressions = []
+    for case in args.case or CASES:
+        for scale in args.scale or SCALES:
+            calibration = calibrate()
+            elapsed = measure(CASES[case], SCALES[scale], args.repeat)
+            normalised = elapsed / calibration
+            baseline = baselines['cases'].get(case, {}).get(scale)
+            status = ''
+            if args.update:
+                baselines['cases'].setdefault(case, {})[scale] = round(normalised, 5)
+            elif baseline:
+                ratio = normalised / baseline
+                status = f"{ratio:6.2f}x"
+                # Instrumented timings include probe overhead, so only report them
+                if ratio > 1 + args.tolerance and not args.instrument:
+                    status += '  REGRESSION'
+                    regressions.append(f"{case} [{scale}] {ratio:.2f}x slower than baseline")
+            print(f"{case:<34} {scale:<7} {elapsed * 1000:10.3f}ms  {normalised:10.5f}  {status}")
+
+    if args.instrument:
+        instrumentation.disable()
+        print()
+        for name, stats in sorted(instrumentation.get_stats().items()):
+            print(f"{name:<34} calls {stats['calls']:>9}  mean {stats['mean_ns']:>10.0f}ns  "
+                  f"p50 {stats['p50_ns']:>9}ns  p99 {stats['p99_ns']:>9}ns")
+    elif args.update:
+        baselines['machine'] = {
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'python': platform.python_version(),
+            'calibration_s': round(calibration, 6),
+        }
+        with open(BASELINES, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baselines written to {BASELINES}")
+
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
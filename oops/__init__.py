@@ -0,0 +1,43 @@
+"""
+Object-oriented Python exercises: bank accounts, course enrollment, grade
+management, text analysis, social media friend analysis and a shopping
+cart.
+
+Submodules are imported on first attribute access, so ``import oops``
+stays cheap and only the systems actually used get loaded.
+"""
+import importlib
+
+_exports = {
+    'Account': 'bank',
+    'SavingsAccount': 'bank',
+    'CheckingAccount': 'bank',
+    'Course': 'courses',
+    'Student': 'courses',
+    'GradeManager': 'grades',
+    'TextAnalyzer': 'text_analysis',
+    'analyze_friendships': 'social_media',
+    'SalesWindow': 'shopping_cart',
+    'SalesAnalytics': 'shopping_cart',
+    'Product': 'shopping_cart',
+    'Customer': 'shopping_cart',
+    'ShoppingCart': 'shopping_cart',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_exports[name]}', __name__)
+    value = getattr(module, name)
+    # Only classes are cached: enabling instrumentation rebinds probed
+    # functions on their module, which a cached copy here would bypass
+    if isinstance(value, type):
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,227 @@
+"""
+Opt-in instrumentation for hot paths: call counters, latency histograms
+and tracing hooks.
+
+Functions are marked with ``@probe(name)``. While instrumentation is
+disabled the decorator leaves the original function in place, so marked
+code runs with no extra cost. ``enable()`` swaps a timing wrapper in for
+every probe and ``disable()`` puts the originals back.
+
+Enabling rebinds the attribute on the class or module that defines it,
+so a function imported by name before ``enable()`` keeps its old binding.
+Functions defined inside another function cannot be rebound; they get a
+wrapper that checks whether instrumentation is enabled on every call.
+"""
+import sys
+import time
+
+_sites = []
+_stats = {}
+_trace_hooks = []
+_enabled = False
+
+
+class ProbeStats:
+    """
+    Call count and power-of-two latency histogram for one probe
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.histogram = [0] * 64  # bucket i holds latencies in [2**(i-1), 2**i) ns
+
+    def record(self, elapsed_ns):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), 63)] += 1
+
+    def percentile(self, fraction):
+        """
+        Estimate a latency percentile from the histogram
+        Args:
+            fraction (float): Percentile as a fraction, e.g. 0.99
+        Returns:
+            int: Upper bound of the bucket holding the percentile, in ns
+        """
+        if not self.calls:
+            return 0
+        target = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return 2 ** bucket
+        return 2 ** 63
+
+    def summary(self):
+        return {
+            'calls': self.calls,
+            'total_ns': self.total_ns,
+            'mean_ns': self.total_ns / self.calls if self.calls else 0,
+            'p50_ns': self.percentile(0.5),
+            'p99_ns': self.percentile(0.99),
+        }
+
+
+class _Site:
+    def __init__(self, name, owner, attr, func):
+        self.name = name
+        self.owner = owner
+        self.attr = attr
+        self.func = func
+        self._wrapper = None
+
+    @property
+    def wrapper(self):
+        # Built on first use so importing a module with probes stays cheap
+        if self._wrapper is None:
+            self._wrapper = _wrap(self.name, self.func)
+        return self._wrapper
+
+    def install(self):
+        setattr(self.owner, self.attr, self.wrapper)
+
+    def uninstall(self):
+        setattr(self.owner, self.attr, self.func)
+
+
+class _PendingMethod:
+    # Stand-in used inside a class body until the owning class exists
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+
+    def __set_name__(self, owner, attr):
+        _register(_Site(self.name, owner, attr, self.func))
+
+
+def _dispatch(site):
+    import functools
+
+    func = site.func
+
+    @functools.wraps(func)
+    def dispatcher(*args, **kwargs):
+        if _enabled:
+            return site.wrapper(*args, **kwargs)
+        return func(*args, **kwargs)
+    return dispatcher
+
+
+def _wrap(name, func):
+    import functools
+
+    stats = _stats.setdefault(name, ProbeStats(name))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            stats.record(elapsed)
+            if _trace_hooks:
+                _run_trace_hooks(name, elapsed)
+    return wrapper
+
+
+def _run_trace_hooks(name, elapsed):
+    # A failing hook is reported but never changes the probed call's result
+    for hook in _trace_hooks:
+        try:
+            hook(name, elapsed)
+        except Exception:
+            import traceback
+
+            traceback.print_exc()
+
+
+def _register(site):
+    _sites.append(site)
+    if _enabled:
+        site.install()
+    else:
+        site.uninstall()
+
+
+def probe(name):
+    """
+    Mark a function or method as an instrumented hot path. Probes sharing
+    a name share one set of statistics, so give overrides their own name
+    to tell them apart.
+    Args:
+        name (str): Name the probe reports under, e.g. 'bank.withdraw'
+    """
+    def decorator(func):
+        qualname = func.__qualname__
+        if '.' in qualname.rpartition('<locals>.')[2]:
+            return _PendingMethod(name, func)
+        if '<locals>' in qualname:
+            return _dispatch(_Site(name, None, func.__name__, func))
+        site = _Site(name, sys.modules[func.__module__], func.__name__, func)
+        _sites.append(site)
+        return site.wrapper if _enabled else func
+    return decorator
+
+
+def enable():
+    global _enabled
+    if not _enabled:
+        _enabled = True
+        for site in _sites:
+            site.install()
+
+
+def disable():
+    global _enabled
+    if _enabled:
+        _enabled = False
+        for site in _sites:
+            site.uninstall()
+
+
+def is_enabled():
+    return _enabled
+
+
+def unregister(owner):
+    """
+    Drop every probe defined on a class or module, restoring its original
+    functions
+    Args:
+        owner: Class or module whose probes should be removed
+    """
+    for site in [site for site in _sites if site.owner is owner]:
+        site.uninstall()
+        _sites.remove(site)
+
+
+def add_trace_hook(hook):
+    """
+    Register a callable invoked as hook(name, elapsed_ns) after every
+    instrumented call while instrumentation is enabled
+    """
+    _trace_hooks.append(hook)
+
+
+def remove_trace_hook(hook):
+    _trace_hooks.remove(hook)
+
+
+def get_stats():
+    """
+    Returns:
+        dict: Probe name mapped to its summary for every probe called so far
+    """
+    return {name: stats.summary() for name, stats in _stats.items() if stats.calls}
+
+
+def reset_stats():
+    for stats in _stats.values():
+        stats.reset()
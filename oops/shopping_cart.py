@@ -0,0 +1,435 @@
+# E-commerce Shopping Cart System
+
+import heapq
+import time
+import weakref
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from .instrumentation import probe
+
+def _tally(lines):
+    # Units per category and per product, so each batch costs one update per key
+    categories = {}
+    products = {}
+    for category, product_id, quantity in lines:
+        categories[category] = categories.get(category, 0) + quantity
+        products[product_id] = products.get(product_id, 0) + quantity
+    return categories, products
+
+
+class SalesWindow:
+    """
+    Rolling sales totals over a fixed time span, kept in a ring buffer of
+    time buckets. Each bucket holds one count per category and product sold
+    in it, so memory is bounded by the bucket count and the keys sold inside
+    the window. Orders are queued and folded into their bucket in batches,
+    and running totals are adjusted as buckets expire, so queries never
+    rescan the history.
+    """
+    PENDING_LIMIT = 256
+
+    def __init__(self, span, bucket_seconds):
+        self.bucket_seconds = bucket_seconds
+        self.size = span // bucket_seconds
+        # Each bucket is [bucket index or None, categories, products, revenue]
+        self._buckets = [[None, Counter(), Counter(), 0] for _ in range(self.size)]
+        self._pending = []
+        self._latest = None
+        self._categories = Counter()
+        self._products = Counter()
+        self.version = 0
+
+    def _flush(self):
+        if self._pending:
+            batches = {}
+            for bucket, lines in self._pending:
+                batches.setdefault(id(bucket), (bucket, []))[1].extend(lines)
+            for bucket, lines in batches.values():
+                categories, products = _tally(lines)
+                for counts in (bucket[1], self._categories):
+                    counts.update(categories)
+                for counts in (bucket[2], self._products):
+                    counts.update(products)
+            self._pending = []
+            self.version += 1
+
+    def _expire(self, bucket):
+        self._flush()
+        _, categories, products, _ = bucket
+        for totals, counts in ((self._categories, categories), (self._products, products)):
+            for key, count in counts.items():
+                totals[key] -= count
+                if totals[key] <= 0:
+                    del totals[key]
+        categories.clear()
+        products.clear()
+        bucket[0] = None
+        bucket[3] = 0
+        self.version += 1
+
+    def advance(self, timestamp):
+        index = int(timestamp // self.bucket_seconds)
+        if self._latest is None:
+            self._latest = index
+        elif index > self._latest:
+            oldest = index - self.size
+            # Only the slots between the previous and the new latest bucket can
+            # hold expired data; a jump past the whole window visits each slot once
+            for step in range(max(self._latest + 1, index - self.size + 1), index + 1):
+                bucket = self._buckets[step % self.size]
+                if bucket[0] is not None and bucket[0] <= oldest:
+                    self._expire(bucket)
+            self._latest = index
+        return index
+
+    def add_order(self, lines, amount, timestamp):
+        """
+        Record one order in the bucket its timestamp falls in
+        Args:
+            lines (list): List of tuples (category, product_id, quantity)
+            amount (float): Order revenue
+            timestamp (float): Time of the order in seconds
+        """
+        index = self.advance(timestamp)
+        if index <= self._latest - self.size:
+            return
+        bucket = self._buckets[index % self.size]
+        if bucket[0] != index:
+            if bucket[0] is not None:
+                self._expire(bucket)
+            bucket[0] = index
+        bucket[3] += amount
+        self._pending.append((bucket, lines))
+        if len(self._pending) >= self.PENDING_LIMIT:
+            self._flush()
+
+    @property
+    def categories(self):
+        self._flush()
+        return self._categories
+
+    @property
+    def products(self):
+        self._flush()
+        return self._products
+
+    @property
+    def revenue(self):
+        # Summed from the live buckets on read so expiry never accumulates float error
+        if self._latest is None:
+            return 0
+        oldest = self._latest - self.size
+        return sum(bucket[3] for bucket in self._buckets if bucket[0] is not None and bucket[0] > oldest)
+
+
+class SalesAnalytics:
+    """
+    Streaming sales analytics fed by order events, with all-time totals
+    and rolling 'hour' and 'day' windows. Top-k answers are cached until
+    the totals behind them change.
+    """
+    WINDOW_SPECS = {'hour': (3600, 60), 'day': (86400, 3600)}
+    PENDING_LIMIT = 4096
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._windows = {name: SalesWindow(span, bucket) for name, (span, bucket) in self.WINDOW_SPECS.items()}
+        self._pending = []
+        self._categories = Counter()
+        self._products = Counter()
+        self._revenue = 0
+        self._version = 0
+        self._top_cache = {}
+
+    def _window(self, window):
+        if window not in self._windows:
+            raise ValueError(f"Unknown window: {window}")
+        sales_window = self._windows[window]
+        sales_window.advance(self.clock())
+        return sales_window
+
+    def _flush(self):
+        if self._pending:
+            categories, products = _tally(self._pending)
+            self._categories.update(categories)
+            self._products.update(products)
+            self._pending = []
+            self._version += 1
+
+    def _top(self, kind, k, window):
+        if window is None:
+            self._flush()
+            totals = self._categories if kind == 'categories' else self._products
+            version = self._version
+        else:
+            sales_window = self._window(window)
+            totals = getattr(sales_window, kind)
+            version = sales_window.version
+        cached = self._top_cache.get((kind, k, window))
+        if cached is None or cached[0] != version:
+            cached = (version, heapq.nlargest(k, totals.items(), key=lambda item: item[1]))
+            self._top_cache[(kind, k, window)] = cached
+        return list(cached[1])
+
+    def record_order(self, items, amount=0, timestamp=None):
+        """
+        Record an order as a single event
+        Args:
+            items (dict): Maps each product sold to its quantity
+            amount (float): Order revenue
+            timestamp (float): Time of the order, defaults to the clock
+        """
+        timestamp = self.clock() if timestamp is None else timestamp
+        lines = [(product.category, product.product_id, quantity) for product, quantity in items.items()]
+        self._pending.extend(lines)
+        if len(self._pending) >= self.PENDING_LIMIT:
+            self._flush()
+        self._revenue += amount
+        for sales_window in self._windows.values():
+            sales_window.add_order(lines, amount, timestamp)
+
+    def top_categories(self, k=1, window=None):
+        """
+        Args:
+            k (int): Number of categories to return
+            window (str): 'hour', 'day' or None for all time
+        Returns:
+            list: List of tuples (category, units_sold)
+        """
+        return self._top('categories', k, window)
+
+    def top_products(self, k=1, window=None):
+        """
+        Args:
+            k (int): Number of products to return
+            window (str): 'hour', 'day' or None for all time
+        Returns:
+            list: List of tuples (product_id, units_sold)
+        """
+        return self._top('products', k, window)
+
+    def get_revenue(self, window=None):
+        if window is None:
+            return self._revenue
+        return self._window(window).revenue
+
+
+sales_analytics = SalesAnalytics()
+
+
+class Product:
+    _products = []
+    _products_by_id = defaultdict(list)
+
+    def __init__(self, product_id, name, price, category, stock_quantity):
+        self.product_id = product_id
+        self.name = name
+        self._price = price
+        self.category = category
+        self.stock_quantity = stock_quantity
+        Product._products.append(self)
+        Product._products_by_id[product_id].append(self)
+
+    @property
+    def price(self):
+        return self._price
+
+    @price.setter
+    def price(self, price):
+        # Every price change goes through here so open cart subtotals stay in step
+        delta = _exact(price) - _exact(self._price)
+        self._price = price
+        ShoppingCart._apply_price_change(self, delta)
+
+    def get_product_info(self):
+        return {
+            'id': self.product_id,
+            'name': self.name,
+            'price': self.price,
+            'category': self.category,
+            'stock_quantity': self.stock_quantity
+        }
+
+    def set_price(self, price):
+        self.price = price
+
+    @classmethod
+    def get_total_products(cls):
+        return len(cls._products)
+
+    @classmethod
+    def get_most_popular_category(cls, window=None):
+        top = sales_analytics.top_categories(1, window)
+        if not top:
+            return None
+        return top[0][0]
+
+    def reduce_stock(self, quantity):
+        if self.stock_quantity >= quantity:
+            self.stock_quantity -= quantity
+            sales_analytics.record_order({self: quantity})
+            return True
+        return False
+
+class Customer:
+    _customers = []
+
+    def __init__(self, customer_id, name, email, membership):
+        self.customer_id = customer_id
+        self.name = name
+        self.email = email
+        self.membership = membership
+        Customer._customers.append(self)
+
+    def __str__(self):
+        return f"{self.name} ({self.email}) - {self.membership}"
+
+    def get_discount_rate(self):
+        if self.membership == "premium":
+            return 20
+        elif self.membership == "gold":
+            return 10
+        return 0
+
+    @classmethod
+    def add_revenue(cls, amount):
+        sales_analytics.record_order({}, amount)
+
+    @classmethod
+    def get_total_revenue(cls, window=None):
+        return sales_analytics.get_revenue(window)
+
+def _exact(price):
+    # Prices as decimals, so a running subtotal never picks up float rounding error
+    return Decimal(str(price))
+
+
+class ShoppingCart:
+    # Carts holding each product, so a price change only touches affected carts.
+    # Weak references let abandoned carts be freed; sets left empty are
+    # pruned the next time their product is repriced.
+    _carts_by_product = {}
+
+    def __init__(self, customer):
+        self.customer = customer
+        self.items = {} 
+        self._subtotal = Decimal(0)
+
+    def add_item(self, product, quantity):
+        if product in self.items:
+            self.items[product] += quantity
+        else:
+            self.items[product] = quantity
+            ShoppingCart._carts_by_product.setdefault(product, weakref.WeakSet()).add(self)
+        self._subtotal += _exact(product.price) * quantity
+
+    def remove_item(self, product_id):
+        for product in list(self.items.keys()):
+            if product.product_id == product_id:
+                self._subtotal -= _exact(product.price) * self.items.pop(product)
+                ShoppingCart._carts_by_product[product].discard(self)
+                break
+
+    def clear_cart(self):
+        for product in self.items:
+            ShoppingCart._carts_by_product[product].discard(self)
+        self.items.clear()
+        self._subtotal = Decimal(0)
+
+    def get_total_items(self):
+        return sum(self.items.values())
+
+    def get_cart_items(self):
+        return {p.product_id: q for p, q in self.items.items()}
+
+    def get_subtotal(self):
+        return float(self._subtotal)
+
+    def calculate_total(self):
+        subtotal = self.get_subtotal()
+        discount = self.customer.get_discount_rate()
+        total = subtotal * (1 - discount / 100)
+        return round(total, 2)
+
+    @probe("shopping_cart.place_order")
+    def place_order(self):
+        for product, quantity in self.items.items():
+            if product.stock_quantity < quantity:
+                return f"Insufficient stock for {product.name}"
+        total = self.calculate_total()
+        for product, quantity in self.items.items():
+            product.stock_quantity -= quantity
+        sales_analytics.record_order(self.items, total)
+        self.clear_cart()
+        return "Order placed successfully"
+
+    @classmethod
+    def reprice(cls, new_prices):
+        """
+        Apply a batch of price changes and update every open cart holding
+        the affected products in one pass.
+        Args:
+            new_prices (dict): Maps product_id to its new price
+        """
+        unknown = [product_id for product_id in new_prices if product_id not in Product._products_by_id]
+        if unknown:
+            raise ValueError(f"Unknown product ids: {', '.join(map(str, unknown))}")
+        for product_id, price in new_prices.items():
+            for product in Product._products_by_id[product_id]:
+                product.price = price
+
+    @classmethod
+    def _apply_price_change(cls, product, delta):
+        carts = cls._carts_by_product.get(product)
+        if carts is None:
+            return
+        for cart in carts:
+            cart._subtotal += delta * cart.items[product]
+        if not carts:
+            del cls._carts_by_product[product]
+
+def main():
+    laptop = Product("P001", "Gaming Laptop", 1299.99, "Electronics", 10)
+    book = Product("P002", "Python Programming", 49.99, "Books", 25)
+    shirt = Product("P003", "Cotton T-Shirt", 19.99, "Clothing", 50)
+
+    print(f"Product info: {laptop.get_product_info()}")
+    print(f"Total products in system: {Product.get_total_products()}")
+
+    customer = Customer("C001", "John Doe", "john@email.com", "premium")
+    cart = ShoppingCart(customer)
+
+    print(f"Customer: {customer}")
+    print(f"Customer discount: {customer.get_discount_rate()}%")
+
+    cart.add_item(laptop, 1)
+    cart.add_item(book, 2)
+    cart.add_item(shirt, 3)
+
+    print(f"Cart total items: {cart.get_total_items()}")
+    print(f"Cart subtotal: ${cart.get_subtotal()}")
+
+    final_total = cart.calculate_total()
+    print(f"Final total (with {customer.get_discount_rate()}% discount): ${final_total}")
+
+    print(f"Laptop stock before order: {laptop.stock_quantity}")
+    order_result = cart.place_order()
+    print(f"Order result: {order_result}")
+    print(f"Laptop stock after order: {laptop.stock_quantity}")
+
+    popular_category = Product.get_most_popular_category()
+    print(f"Most popular category: {popular_category}")
+
+    total_revenue = Customer.get_total_revenue()
+    print(f"Total revenue: ${total_revenue}")
+
+    cart.remove_item("P002")
+    print(f"Items after removal: {cart.get_cart_items()}")
+
+    cart.clear_cart()
+    print(f"Items after clearing: {cart.get_total_items()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+from .instrumentation import probe
+
+
+@probe("social_media.analyze_friendships")
+def analyze_friendships(facebook_friends=None, instagram_friends=None, twitter_friends=None,
+                        linkedin_friends=None):
+    """
+    Analyze friendship patterns across different social media platforms
+    Args:
+        facebook_friends (set): Friends on Facebook, sample data if omitted
+        instagram_friends (set): Friends on Instagram, sample data if omitted
+        twitter_friends (set): Friends on Twitter, sample data if omitted
+        linkedin_friends (set): Friends on LinkedIn, sample data if omitted
+    """
+    if facebook_friends is None:
+        facebook_friends = {"alice", "bob", "charlie", "diana", "eve", "frank"}
+    if instagram_friends is None:
+        instagram_friends = {"bob", "charlie", "grace", "henry", "alice", "ivan"}
+    if twitter_friends is None:
+        twitter_friends = {"alice", "diana", "grace", "jack", "bob", "karen"}
+    if linkedin_friends is None:
+        linkedin_friends = {"charlie", "diana", "frank", "grace", "luke", "mary"}
+
+    all_platforms = (
+        facebook_friends
+        & instagram_friends
+        & twitter_friends
+        & linkedin_friends
+    )
+
+    facebook_only = facebook_friends - (
+        instagram_friends | twitter_friends | linkedin_friends
+    )
+
+    instagram_xor_twitter = instagram_friends ^ twitter_friends
+
+    total_unique = (
+        facebook_friends
+        | instagram_friends
+        | twitter_friends
+        | linkedin_friends
+    )
+
+    # 5. Find friends who are on exactly 2 platforms
+    from collections import Counter
+
+    all_friends = (
+        list(facebook_friends)
+        + list(instagram_friends)
+        + list(twitter_friends)
+        + list(linkedin_friends)
+    )
+    friend_counts = Counter(all_friends)
+    exactly_two_platforms = {friend for friend, count in friend_counts.items() if count == 2}
+
+    return {
+        "all_platforms": all_platforms,
+        "facebook_only": facebook_only,
+        "instagram_xor_twitter": instagram_xor_twitter,
+        "total_unique": total_unique,
+        "exactly_two_platforms": exactly_two_platforms,
+    }
+
+def main():
+    result = analyze_friendships()
+    print("All platforms:", result["all_platforms"])
+    print("Facebook only:", result["facebook_only"])
+    print("Instagram XOR Twitter:", result["instagram_xor_twitter"])
+    print("Total unique:", result["total_unique"])
+    print("Exactly two platforms:", result["exactly_two_platforms"])
+
+
+if __name__ == "__main__":
+    main()
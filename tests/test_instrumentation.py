@@ -0,0 +1,92 @@
+import pytest
+
+import oops
+from oops import instrumentation
+from oops.bank import Account, CheckingAccount
+
+
+@pytest.fixture(autouse=True)
+def enabled():
+    instrumentation.reset_stats()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset_stats()
+
+
+def test_methods_are_only_wrapped_while_enabled():
+    account = Account("A1", "Jane", 100)
+    account.withdraw(10)
+    instrumentation.disable()
+    assert not hasattr(Account.withdraw, "__wrapped__")
+    account.withdraw(10)
+    assert instrumentation.get_stats()["bank.withdraw"]["calls"] == 1
+
+
+def test_package_reexport_is_instrumented():
+    from oops import social_media
+
+    oops.analyze_friendships()
+    social_media.analyze_friendships()
+    assert instrumentation.get_stats()["social_media.analyze_friendships"]["calls"] == 2
+
+
+def test_trace_hooks_receive_every_call():
+    seen = []
+    hook = lambda name, elapsed: seen.append(name)  # noqa: E731
+    instrumentation.add_trace_hook(hook)
+    try:
+        Account("A1", "Jane", 100).withdraw(10)
+    finally:
+        instrumentation.remove_trace_hook(hook)
+    assert seen == ["bank.withdraw"]
+
+
+def test_nested_functions_can_be_probed():
+    def outer():
+        @instrumentation.probe("test.nested")
+        def nested(x):
+            return x * 2
+        return nested
+
+    nested = outer()
+    assert nested(2) == 4
+    instrumentation.disable()
+    assert nested(3) == 6
+    assert instrumentation.get_stats()["test.nested"]["calls"] == 1
+
+
+def test_methods_of_local_classes_can_be_probed():
+    class Local:
+        @instrumentation.probe("test.local_method")
+        def double(self, x):
+            return x * 2
+
+    try:
+        assert Local().double(2) == 4
+        assert instrumentation.get_stats()["test.local_method"]["calls"] == 1
+    finally:
+        instrumentation.unregister(Local)
+    assert all(site.owner is not Local for site in instrumentation._sites)
+
+
+def test_failing_trace_hook_does_not_change_result(capsys):
+    def hook(name, elapsed):
+        raise RuntimeError("hook failed")
+
+    instrumentation.add_trace_hook(hook)
+    try:
+        assert Account("A1", "Jane", 100).withdraw(10) is True
+        with pytest.raises(ValueError):
+            Account("A2", "Jane", 100).withdraw(-1)
+    finally:
+        instrumentation.remove_trace_hook(hook)
+    assert "hook failed" in capsys.readouterr().err
+
+
+def test_overrides_report_separately():
+    Account("A1", "Jane", 100).withdraw(10)
+    CheckingAccount("C1", "Jane", 100, 50).withdraw(10)
+    stats = instrumentation.get_stats()
+    assert stats["bank.withdraw"]["calls"] == 1
+    assert stats["bank.checking_withdraw"]["calls"] == 1
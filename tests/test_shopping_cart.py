@@ -0,0 +1,217 @@
+import gc
+
+import pytest
+
+from oops import shopping_cart
+from oops.shopping_cart import Customer, Product, SalesAnalytics, ShoppingCart
+
+START = 1_000_000.0
+
+
+class FakeClock:
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def analytics(clock, monkeypatch):
+    analytics = SalesAnalytics(clock=clock)
+    monkeypatch.setattr(shopping_cart, "sales_analytics", analytics)
+    return analytics
+
+
+@pytest.fixture(autouse=True)
+def clean_registries():
+    yield
+    Product._products.clear()
+    Product._products_by_id.clear()
+    Customer._customers.clear()
+    ShoppingCart._carts_by_product.clear()
+
+
+def make_cart(membership="basic"):
+    return ShoppingCart(Customer("C1", "Jane", "jane@shop.com", membership))
+
+
+def test_subtotal_tracks_add_and_remove():
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    pen = Product("P2", "Pen", 2.5, "Office", 5)
+    cart = make_cart("gold")
+    cart.add_item(book, 2)
+    cart.add_item(pen, 4)
+    assert cart.get_subtotal() == 30.0
+    assert cart.calculate_total() == 27.0
+    cart.remove_item("P1")
+    assert cart.get_subtotal() == 10.0
+    cart.clear_cart()
+    assert cart.get_subtotal() == 0
+
+
+def test_direct_price_assignment_updates_open_carts():
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    cart = make_cart()
+    cart.add_item(book, 2)
+    book.price = 12.0
+    assert cart.get_subtotal() == 24.0
+
+
+def test_reprice_updates_every_cart_and_duplicate_ids():
+    first = Product("P1", "Book", 10.0, "Books", 5)
+    second = Product("P1", "Book (copy)", 10.0, "Books", 5)
+    cart_a, cart_b = make_cart(), make_cart()
+    cart_a.add_item(first, 1)
+    cart_b.add_item(second, 3)
+    ShoppingCart.reprice({"P1": 20.0})
+    assert first.price == second.price == 20.0
+    assert cart_a.get_subtotal() == 20.0
+    assert cart_b.get_subtotal() == 60.0
+
+
+def test_reprice_rejects_unknown_ids_without_partial_update():
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    with pytest.raises(ValueError):
+        ShoppingCart.reprice({"P1": 20.0, "missing": 1.0})
+    assert book.price == 10.0
+
+
+def test_abandoned_carts_are_released():
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    cart = make_cart()
+    cart.add_item(book, 1)
+    del cart
+    gc.collect()
+    book.price = 11.0
+    assert book not in ShoppingCart._carts_by_product
+
+
+def test_emptied_carts_are_dropped_from_index():
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    cart = make_cart()
+    cart.add_item(book, 1)
+    cart.remove_item("P1")
+    assert cart not in ShoppingCart._carts_by_product[book]
+    book.price = 11.0
+    assert book not in ShoppingCart._carts_by_product
+
+
+def test_subtotal_is_exact_for_non_representable_prices():
+    dime = Product("P1", "Dime", 0.1, "Coins", 5)
+    double_dime = Product("P2", "Double dime", 0.2, "Coins", 5)
+    cart = make_cart()
+    cart.add_item(dime, 1)
+    cart.add_item(double_dime, 1)
+    cart.remove_item("P2")
+    assert cart.get_subtotal() == 0.1
+    cart.add_item(double_dime, 1)
+    cart.remove_item("P1")
+    assert cart.get_subtotal() == 0.2
+    cart.add_item(dime, 3)
+    double_dime.price = 0.7
+    dime.price = 0.3
+    assert cart.get_subtotal() == 1.6
+
+
+def test_window_keeps_sales_until_the_edge(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    analytics.record_order({book: 2}, 20.0)
+    clock.now += 3600 - 60
+    assert analytics.top_categories(1, "hour") == [("Books", 2)]
+    assert analytics.get_revenue("hour") == 20.0
+    clock.now += 60
+    assert analytics.top_categories(1, "hour") == []
+    assert analytics.get_revenue("hour") == 0
+    assert analytics.top_categories(1, "day") == [("Books", 2)]
+
+
+def test_out_of_order_events_land_in_their_bucket(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    pen = Product("P2", "Pen", 1.0, "Office", 5)
+    analytics.record_order({book: 1}, 10.0)
+    analytics.record_order({pen: 3}, 3.0, timestamp=START - 600)
+    assert analytics.top_products(2, "hour") == [("P2", 3), ("P1", 1)]
+    clock.now += 3000 + 60
+    assert analytics.top_products(2, "hour") == [("P1", 1)]
+    assert analytics.get_revenue("hour") == 10.0
+
+
+def test_events_older_than_window_only_count_all_time(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    analytics.record_order({book: 4}, 40.0, timestamp=START - 7200)
+    assert analytics.top_products(1, "hour") == []
+    assert analytics.top_products(1, "day") == [("P1", 4)]
+    assert analytics.top_products(1) == [("P1", 4)]
+    assert analytics.get_revenue() == 40.0
+
+
+def test_jump_longer_than_window_clears_everything(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    for minute in range(30):
+        analytics.record_order({book: 1}, 0.1, timestamp=START + minute * 60)
+    clock.now = START + 2 * 86400
+    assert analytics.top_categories(1, "hour") == []
+    assert analytics.top_categories(1, "day") == []
+    analytics.record_order({book: 1}, 0.3)
+    assert analytics.get_revenue("hour") == 0.3
+    assert analytics.top_products(1, "day") == [("P1", 1)]
+
+
+def test_window_revenue_does_not_drift(clock, analytics):
+    for minute in range(59):
+        analytics.record_order({}, 0.1, timestamp=START + minute * 60)
+    clock.now = START + 59 * 60
+    analytics.record_order({}, 0.3)
+    clock.now += 3600 - 60
+    assert analytics.get_revenue("hour") == 0.3
+
+
+def test_unknown_window_raises(analytics):
+    with pytest.raises(ValueError):
+        analytics.get_revenue("week")
+
+
+def test_place_order_feeds_windowed_queries(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    shirt = Product("P2", "Shirt", 20.0, "Clothing", 5)
+    cart = make_cart()
+    cart.add_item(shirt, 1)
+    assert cart.place_order() == "Order placed successfully"
+    clock.now += 7200
+    cart.add_item(book, 1)
+    cart.place_order()
+    assert Product.get_most_popular_category() in ("Books", "Clothing")
+    assert Product.get_most_popular_category(window="hour") == "Books"
+    assert Customer.get_total_revenue(window="hour") == 10.0
+    assert Customer.get_total_revenue() == 30.0
+    assert book.stock_quantity == 4
+
+
+def test_window_memory_is_bounded_by_keys(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    pen = Product("P2", "Pen", 1.0, "Office", 5)
+    for _ in range(5000):
+        analytics.record_order({book: 1, pen: 2}, 12.0)
+        clock.now += 1
+    for sales_window in analytics._windows.values():
+        assert len(sales_window._pending) < sales_window.PENDING_LIMIT
+        for bucket in sales_window._buckets:
+            assert len(bucket[1]) <= 2 and len(bucket[2]) <= 2
+    assert len(analytics._pending) < SalesAnalytics.PENDING_LIMIT
+    assert analytics.top_products(2) == [("P2", 10000), ("P1", 5000)]
+
+
+def test_cached_top_k_follows_new_orders(clock, analytics):
+    book = Product("P1", "Book", 10.0, "Books", 5)
+    pen = Product("P2", "Pen", 1.0, "Office", 5)
+    analytics.record_order({book: 2})
+    assert analytics.top_products(1, "hour") == [("P1", 2)]
+    analytics.record_order({pen: 3})
+    assert analytics.top_products(1, "hour") == [("P2", 3)]
+    assert analytics.top_products(1) == [("P2", 3)]